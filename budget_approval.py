@@ -1,9 +1,126 @@
 import pandas as pd
+import numpy as np
 import os
 import json
+import mmap
+import re
 from datetime import datetime
 from typing import Dict, List, Tuple, Optional
 
+from budget_automation import top_n_positions, write_excel_report
+
+# Copy-on-Write lets unmodified copies share column buffers (always on in pandas >= 3)
+if int(pd.__version__.split('.')[0]) < 3:
+    pd.set_option('mode.copy_on_write', True)
+
+# PyArrow's multi-threaded CSV parser is used when available
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# orjson serializes the approval log faster than the stdlib json module
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Explicit column types for budget CSVs so the parser skips type inference
+BUDGET_CSV_DTYPES = {
+    'Category': str,
+    'Name': str,
+    'Formatted Amount': str,
+    'Percentage': 'float64',
+}
+
+
+class _NumericCharTable(dict):
+    """
+    str.translate table that keeps digits and '.' and deletes everything else
+    (currency symbols, thousands separators, spaces)
+    """
+    def __init__(self):
+        super().__init__((ord(c), ord(c)) for c in '0123456789.')
+
+    def __missing__(self, codepoint):
+        self[codepoint] = None
+        return None
+
+
+_NUMERIC_CHARS = _NumericCharTable()
+
+
+def _strip_non_numeric(text: str) -> str:
+    """Strip everything but digits and '.' from a formatted amount"""
+    return text.translate(_NUMERIC_CHARS)
+
+
+_AMOUNT_CHARS_RE = re.compile(r'[\d.,]+')
+
+
+def _parse_amounts(formatted: pd.Series) -> pd.Series:
+    """
+    Parse '<symbol>1,234' strings to float64, in Arrow compute kernels when pyarrow is available
+    """
+    if PYARROW_AVAILABLE:
+        digits = pc.replace_substring_regex(pa.array(formatted, type=pa.string()), r'[^\d.]+', '')
+        return pd.Series(pc.cast(digits, pa.float64()).to_numpy(zero_copy_only=False),
+                         index=formatted.index, name=formatted.name)
+    return formatted.map(_strip_non_numeric, na_action='ignore').astype(float)
+
+
+def _extract_currency_symbol(formatted: str) -> str:
+    """Return the currency part of a formatted amount, e.g. 'Rp' from 'Rp1,000'"""
+    if not isinstance(formatted, str):
+        return ""
+    return _AMOUNT_CHARS_RE.sub('', formatted)
+
+
+def _json_line(entry: Dict) -> bytes:
+    """Serialize one log entry as a UTF-8 encoded JSON Lines record"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_SERIALIZE_NUMPY)
+    return (json.dumps(entry) + '\n').encode('utf-8')
+
+
+def _json_loads(line):
+    """Parse one JSON Lines record"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(line)
+    return json.loads(line)
+
+
+# Prefix for signed amounts keyed on sign(value); negatives carry their own '-'
+_SIGN_PREFIX = {1: '+', 0: '', -1: ''}
+
+
+def _format_amounts(amounts: pd.Series, currency_symbol: str = "") -> List[str]:
+    """Format a numeric column as '<symbol>1,234' strings in a single pass"""
+    return [f"{currency_symbol}{amount:,.0f}" for amount in amounts.to_numpy().tolist()]
+
+
+def _emergency_mask(df: pd.DataFrame) -> pd.Series:
+    """True for rows whose category is an emergency fund"""
+    categories = df['Category']
+    if isinstance(categories.dtype, pd.CategoricalDtype):
+        # Match each distinct label once, then compare integer codes
+        labels = categories.cat.categories
+        emergency_codes = [code for code, label in enumerate(labels) if 'emergency' in str(label).lower()]
+        return pd.Series(np.isin(categories.cat.codes.to_numpy(), emergency_codes), index=df.index)
+    return categories.str.contains('Emergency', case=False, na=False, regex=False)
+
+
+def _scan_rules(pcts: np.ndarray, emergency_mask: np.ndarray, max_item_pct: float) -> Tuple[float, np.ndarray]:
+    """
+    Numeric part of the approval rules on raw arrays
+    Returns: (emergency_percentage, positions_of_items_over_max_item_pct)
+    """
+    return float(np.nansum(pcts[emergency_mask])), np.flatnonzero(pcts > max_item_pct)
+
+
 class BudgetApprovalSystem:
     """
     Budget Approval System for processing and approving budgets created by main.py
@@ -18,7 +135,10 @@ class BudgetApprovalSystem:
             "min_emergency_percentage": 10,  # Minimum percentage for emergency fund
         }
         self.output_dir = "output"
-        self.approval_log_file = os.path.join(self.output_dir, "approval_log.json")
+        os.makedirs(self.output_dir, exist_ok=True)
+        self.approval_log_file = os.path.join(self.output_dir, "approval_log.jsonl")
+        # Set when an adjustment is written, replaces full-frame df.equals() scans
+        self._dirty = False
     
     def load_budget_from_csv(self, csv_file_path: str) -> Optional[pd.DataFrame]:
         """
@@ -29,7 +149,10 @@ class BudgetApprovalSystem:
                 print(f"Error: File '{csv_file_path}' not found.")
                 return None
             
-            df = pd.read_csv(csv_file_path)
+            if PYARROW_AVAILABLE:
+                df = pd.read_csv(csv_file_path, engine='pyarrow', dtype=BUDGET_CSV_DTYPES)
+            else:
+                df = pd.read_csv(csv_file_path, dtype=BUDGET_CSV_DTYPES)
             
             # Validate required columns
             required_columns = ['Category', 'Name', 'Formatted Amount', 'Percentage']
@@ -37,8 +160,21 @@ class BudgetApprovalSystem:
                 print(f"Error: CSV file must contain columns: {required_columns}")
                 return None
             
+            # Few distinct categories: grouping and matching work on integer codes
+            df['Category'] = df['Category'].astype('category')
+            if PYARROW_AVAILABLE:
+                df['Name'] = df['Name'].astype('string[pyarrow]')
+            
             # Extract numeric amount from formatted amount
-            df['Amount'] = df['Formatted Amount'].str.replace(r'[^\d.]', '', regex=True).astype(float)
+            df['Amount'] = _parse_amounts(df['Formatted Amount'])
+            
+            # Flag emergency-fund rows once so approval checks skip the string scan
+            df['_is_emergency'] = _emergency_mask(df)
+            
+            # Remember the currency symbol once; attrs survive copies of the frame
+            df.attrs['currency_symbol'] = (
+                _extract_currency_symbol(df['Formatted Amount'].iat[0]) if len(df) > 0 else ""
+            )
             
             print(f"Successfully loaded budget from '{csv_file_path}'")
             print(f"Total items: {len(df)}")
@@ -50,17 +186,18 @@ class BudgetApprovalSystem:
     
     def calculate_total_amount(self, df: pd.DataFrame) -> float:
         """Calculate total budget amount"""
-        return df['Amount'].sum()
+        # float64 NumPy reduction; nansum keeps Series.sum's skip-NaN behaviour
+        return float(np.nansum(df['Amount'].to_numpy(dtype=np.float64)))
     
     def get_category_summary(self, df: pd.DataFrame) -> pd.DataFrame:
         """Get summary by category"""
-        category_summary = df.groupby('Category').agg({
-            'Amount': 'sum',
-            'Percentage': 'sum',
-            'Name': 'count'
-        }).rename(columns={'Name': 'Item_Count'})
-        
-        return category_summary.reset_index()
+        # Named aggregation in one pass; groups keep first-appearance order
+        category_summary = df.groupby('Category', observed=True, sort=False).agg(
+            Amount=('Amount', 'sum'),
+            Percentage=('Percentage', 'sum'),
+            Item_Count=('Name', 'size'),
+        ).reset_index()
+        return category_summary
     
     def check_approval_rules(self, df: pd.DataFrame) -> Tuple[bool, List[str]]:
         """
@@ -69,32 +206,50 @@ class BudgetApprovalSystem:
         """
         issues = []
         
+        # Thresholds are read once per check; approval_rules may be edited between checks
+        rules = self.approval_rules
+        max_total = rules["max_total_amount"]
+        max_category_pct = rules["max_category_percentage"]
+        max_item_pct = rules["max_item_percentage"]
+        min_emergency_pct = rules["min_emergency_percentage"]
+        
         # Check total amount
         total_amount = self.calculate_total_amount(df)
-        if total_amount > self.approval_rules["max_total_amount"]:
-            issues.append(f"Total budget ({total_amount:,.0f}) exceeds maximum allowed ({self.approval_rules['max_total_amount']:,.0f})")
+        if total_amount > max_total:
+            issues.append(f"Total budget ({total_amount:,.0f}) exceeds maximum allowed ({max_total:,.0f})")
         
-        # Check category percentages
+        # Check category percentages (only the violating rows are formatted)
         category_summary = self.get_category_summary(df)
-        for _, row in category_summary.iterrows():
-            if row['Percentage'] > self.approval_rules["max_category_percentage"]:
-                issues.append(f"Category '{row['Category']}' ({row['Percentage']:.1f}%) exceeds maximum allowed ({self.approval_rules['max_category_percentage']}%)")
-        
-        # Check individual item percentages
-        for _, row in df.iterrows():
-            if row['Percentage'] > self.approval_rules["max_item_percentage"]:
-                issues.append(f"Item '{row['Name']}' ({row['Percentage']:.1f}%) exceeds maximum allowed ({self.approval_rules['max_item_percentage']}%)")
-        
+        category_pcts = category_summary['Percentage'].to_numpy()
+        over_category = category_pcts > max_category_pct
+        issues.extend(
+            f"Category '{category}' ({pct:.1f}%) exceeds maximum allowed ({max_category_pct}%)"
+            for category, pct in zip(category_summary['Category'].to_numpy()[over_category].tolist(),
+                                     category_pcts[over_category].tolist())
+        )
+
+        # Check individual item percentages and sum the emergency share in one numeric pass
+        pcts = df['Percentage'].to_numpy(dtype=float)
+        if '_is_emergency' in df.columns:
+            emergency_mask = df['_is_emergency'].to_numpy(dtype=bool)
+        else:
+            emergency_mask = _emergency_mask(df).to_numpy(dtype=bool)
+        emergency_percentage, over_item = _scan_rules(pcts, emergency_mask, max_item_pct)
+        names = df['Name'].to_numpy()
+        issues.extend(
+            f"Item '{names[i]}' ({pcts[i]:.1f}%) exceeds maximum allowed ({max_item_pct}%)"
+            for i in over_item.tolist()
+        )
+
         # Check required categories
-        existing_categories = df['Category'].unique()
-        for required_cat in self.approval_rules["required_categories"]:
+        existing_categories = set(df['Category'].unique())
+        for required_cat in rules["required_categories"]:
             if required_cat not in existing_categories:
                 issues.append(f"Required category '{required_cat}' is missing")
         
         # Check emergency fund minimum
-        emergency_percentage = df[df['Category'].str.contains('Emergency', case=False, na=False)]['Percentage'].sum()
-        if emergency_percentage < self.approval_rules["min_emergency_percentage"]:
-            issues.append(f"Emergency fund ({emergency_percentage:.1f}%) is below minimum required ({self.approval_rules['min_emergency_percentage']}%)")
+        if emergency_percentage < min_emergency_pct:
+            issues.append(f"Emergency fund ({emergency_percentage:.1f}%) is below minimum required ({min_emergency_pct}%)")
         
         is_approved = len(issues) == 0
         return is_approved, issues
@@ -114,15 +269,15 @@ class BudgetApprovalSystem:
         print("\nCATEGORY BREAKDOWN:")
         print("-" * 40)
         category_summary = self.get_category_summary(df)
-        for _, row in category_summary.iterrows():
-            print(f"{row['Category']:<20} | {row['Amount']:>10,.0f} | {row['Percentage']:>6.1f}% | {row['Item_Count']:>3} items")
+        for category, amount, pct, count in category_summary.itertuples(index=False, name=None):
+            print(f"{category:<20} | {amount:>10,.0f} | {pct:>6.1f}% | {count:>3} items")
         
         # Top 5 largest expenses
         print(f"\nTOP 5 LARGEST EXPENSES:")
         print("-" * 40)
-        top_expenses = df.nlargest(5, 'Amount')[['Name', 'Category', 'Amount', 'Percentage']]
-        for _, row in top_expenses.iterrows():
-            print(f"{row['Name']:<25} | {row['Category']:<15} | {row['Amount']:>8,.0f} | {row['Percentage']:>5.1f}%")
+        top_expenses = df.iloc[top_n_positions(df['Amount'], 5)][['Name', 'Category', 'Amount', 'Percentage']]
+        for row in top_expenses.itertuples(index=False):
+            print(f"{row.Name:<25} | {row.Category:<15} | {row.Amount:>8,.0f} | {row.Percentage:>5.1f}%")
     
     def adjust_budget_amounts(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, str]:
         """
@@ -135,16 +290,20 @@ class BudgetApprovalSystem:
         print("You can modify the approved amount for each budget item individually")
         
         # Display current budget with clear formatting
-        print(f"\nCURRENT BUDGET ITEMS (Total: {self.calculate_total_amount(df):,.0f}):")
+        original_total = self.calculate_total_amount(df)
+        print(f"\nCURRENT BUDGET ITEMS (Total: {original_total:,.0f}):")
         print("-" * 70)
         print(f"{'#':<3} {'Item Name':<30} {'Category':<15} {'Current Amount':>15}")
         print("-" * 70)
         
-        for idx, row in df.iterrows():
-            print(f"{idx+1:2d}. {row['Name']:<30} {row['Category']:<15} {row['Amount']:>15,.0f}")
+        for idx, (name, category, amount) in enumerate(df[['Name', 'Category', 'Amount']].itertuples(index=False, name=None)):
+            print(f"{idx+1:2d}. {name:<30} {category:<15} {amount:>15,.0f}")
         
         adjustments = []
-        modified_df = df.copy()
+        # Item position -> new amount, applied to a single copy once the user is done
+        pending = {}
+        modified_df = df
+        self._dirty = False
         
         print(f"\n{'='*70}")
         print("ADJUSTMENT OPTIONS:")
@@ -162,7 +321,7 @@ class BudgetApprovalSystem:
             elif selection == 'all':
                 print("\nReviewing all budget items...")
                 for idx in range(len(df)):
-                    self._adjust_single_item(df, modified_df, idx, adjustments)
+                    self._adjust_single_item(df, idx, adjustments, pending)
                 break
             else:
                 try:
@@ -175,7 +334,7 @@ class BudgetApprovalSystem:
                     print(f"\nAdjusting {len(selected_indices)} selected item(s)...")
                     for idx in selected_indices:
                         if 0 <= idx < len(df):
-                            self._adjust_single_item(df, modified_df, idx, adjustments)
+                            self._adjust_single_item(df, idx, adjustments, pending)
                         else:
                             print(f"❌ Invalid item number: {idx + 1}")
                     break
@@ -183,10 +342,12 @@ class BudgetApprovalSystem:
                 except ValueError:
                     print("❌ Invalid input. Please enter item numbers (e.g., 1,3,5), 'all', or 'done'")
         
+        if pending:
+            modified_df = self._apply_adjustments(df, pending)
+        
         if adjustments:
             # Recalculate percentages after adjustments
-            total_new_amount = modified_df['Amount'].sum()
-            original_total = df['Amount'].sum()
+            total_new_amount = self.calculate_total_amount(modified_df)
             modified_df['Percentage'] = round((modified_df['Amount'] / total_new_amount) * 100, 2)
             
             # Update formatted amounts (preserve currency from original)
@@ -204,10 +365,26 @@ class BudgetApprovalSystem:
         
         return modified_df, adjustment_notes
 
-    def _adjust_single_item(self, original_df: pd.DataFrame, modified_df: pd.DataFrame, 
-                           idx: int, adjustments: List[str]):
+    def _apply_adjustments(self, original_df: pd.DataFrame, pending: Dict[int, float]) -> pd.DataFrame:
+        """
+        Copy original_df and write all pending amounts in one .loc assignment,
+        recording the previous amounts in Original_Amount
+        """
+        self._dirty = True
+        modified_df = original_df.copy()
+        if 'Original_Amount' not in modified_df.columns:
+            modified_df['Original_Amount'] = np.nan
+        
+        idxs = list(pending)
+        modified_df.loc[idxs, 'Original_Amount'] = original_df.loc[idxs, 'Amount'].to_numpy()
+        modified_df.loc[idxs, 'Amount'] = list(pending.values())
+        return modified_df
+
+    def _adjust_single_item(self, original_df: pd.DataFrame, idx: int,
+                           adjustments: List[str], pending: Dict[int, float]):
         """
-        Adjust a single budget item amount
+        Ask for the approved amount of a single budget item
+        Changes are queued in pending and applied by _apply_adjustments
         """
         row = original_df.iloc[idx]
         current_amount = row['Amount']
@@ -225,8 +402,7 @@ class BudgetApprovalSystem:
                 break
             elif action in ['r', 'remove']:
                 # Set amount to 0 to effectively remove the item
-                modified_df.loc[idx, 'Amount'] = 0
-                modified_df.loc[idx, 'Original_Amount'] = current_amount
+                pending[idx] = 0.0
                 adjustment_note = f"{row['Name']}: {current_amount:,.0f} → REMOVED"
                 adjustments.append(adjustment_note)
                 print(f"   ❌ Removed: {row['Name']}")
@@ -241,9 +417,8 @@ class BudgetApprovalSystem:
                             print("   ❌ Amount cannot be negative. Please try again.")
                             continue
                         
-                        # Update the DataFrame
-                        modified_df.loc[idx, 'Amount'] = new_amount
-                        modified_df.loc[idx, 'Original_Amount'] = current_amount
+                        # Queue the update for the DataFrame
+                        pending[idx] = new_amount
                         
                         # Record the adjustment
                         if new_amount == 0:
@@ -266,14 +441,23 @@ class BudgetApprovalSystem:
         Update formatted amounts preserving original currency format
         """
         if len(original_df) > 0:
-            # Extract currency format from first item
-            original_formatted = original_df.iloc[0]['Formatted Amount']
-            currency_part = ''.join([c for c in original_formatted if not c.isdigit() and c not in '.,'])
+            currency_part = self._get_currency_symbol(original_df)
             
             # Update formatted amounts
-            modified_df['Formatted Amount'] = modified_df['Amount'].apply(
-                lambda x: f"{currency_part}{x:,.0f}" if currency_part else f"{x:,.0f}"
-            )
+            modified_df['Formatted Amount'] = _format_amounts(modified_df['Amount'], currency_part)
+
+    def _get_currency_symbol(self, df: pd.DataFrame) -> str:
+        """
+        Currency symbol of a loaded budget, extracted once in load_budget_from_csv
+        and carried in df.attrs (falls back to scanning the first formatted amount)
+        """
+        currency_symbol = df.attrs.get('currency_symbol')
+        if currency_symbol is None:
+            currency_symbol = ""
+            if len(df) > 0 and 'Formatted Amount' in df.columns:
+                currency_symbol = _extract_currency_symbol(df['Formatted Amount'].iat[0])
+            df.attrs['currency_symbol'] = currency_symbol
+        return currency_symbol
 
     def partial_approval_process(self, df: pd.DataFrame, issues: List[str]) -> Tuple[bool, pd.DataFrame, str]:
         """
@@ -321,17 +505,16 @@ class BudgetApprovalSystem:
                 
                 # Show final summary
                 new_total = self.calculate_total_amount(modified_df)
-                original_total = self.calculate_total_amount(df)
                 
                 print(f"\n{'='*70}")
                 print("ADJUSTMENT SUMMARY:")
-                print(f"  Original Total: {original_total:,.0f}")
+                print(f"  Original Total: {total_amount:,.0f}")
                 print(f"  Adjusted Total: {new_total:,.0f}")
-                print(f"  Net Change: {new_total - original_total:+,.0f}")
+                print(f"  Net Change: {new_total - total_amount:+,.0f}")
                 print("="*70)
                 
                 # Final approval confirmation
-                if modified_df.equals(df):
+                if not self._dirty:
                     print("No changes were made to the budget.")
                     approve_unchanged = input("Approve original budget anyway? (y/n): ").strip().lower()
                     if approve_unchanged in ['y', 'yes']:
@@ -374,29 +557,23 @@ class BudgetApprovalSystem:
         return approved
     
     def log_approval_decision(self, csv_file: str, df: pd.DataFrame, approved: bool, issues: List[str], notes: str = ""):
-        """Log approval decision to JSON file"""
-        
-        os.makedirs(self.output_dir, exist_ok=True)
-        
-        # Load existing log or create new
-        approval_log = []
-        if os.path.exists(self.approval_log_file):
-            try:
-                with open(self.approval_log_file, 'r') as f:
-                    approval_log = json.load(f)
-            except:
-                approval_log = []
+        """Append approval decision to the JSON Lines log (one entry per line)"""
         
         # Create new log entry
         modifications = []
         if 'Original_Amount' in df.columns:
-            for _, row in df.iterrows():
-                if pd.notna(row.get('Original_Amount')) and row['Original_Amount'] != row['Amount']:
-                    modifications.append({
-                        "item": row['Name'],
-                        "original_amount": float(row['Original_Amount']),
-                        "approved_amount": float(row['Amount'])
-                    })
+            changed = df.loc[
+                df['Original_Amount'].notna() & (df['Original_Amount'] != df['Amount']),
+                ['Name', 'Original_Amount', 'Amount']
+            ]
+            modifications = [
+                {"item": name, "original_amount": original, "approved_amount": approved}
+                for name, original, approved in zip(
+                    changed['Name'].tolist(),
+                    changed['Original_Amount'].astype(float).tolist(),
+                    changed['Amount'].astype(float).tolist()
+                )
+            ]
         
         log_entry = {
             "timestamp": datetime.now().isoformat(),
@@ -411,48 +588,72 @@ class BudgetApprovalSystem:
             "has_modifications": len(modifications) > 0
         }
         
-        approval_log.append(log_entry)
-        
-        # Save updated log
-        with open(self.approval_log_file, 'w') as f:
-            json.dump(approval_log, f, indent=2)
+        # Append-only: previous entries are never read or rewritten
+        with open(self.approval_log_file, 'ab') as f:
+            f.write(_json_line(log_entry))
         
         print(f"Approval decision logged to '{self.approval_log_file}'")
     
+    def read_log(self):
+        """
+        Yield logged approval decisions one entry at a time, oldest first
+        The log is memory-mapped, so only the entries actually consumed are decoded
+        """
+        if not os.path.exists(self.approval_log_file) or os.path.getsize(self.approval_log_file) == 0:
+            return
+        
+        with open(self.approval_log_file, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start = 0
+            size = len(mm)
+            while start < size:
+                end = mm.find(b'\n', start)
+                if end == -1:
+                    end = size
+                line = mm[start:end]
+                start = end + 1
+                if line.strip():
+                    yield _json_loads(line)
+    
     def generate_approval_report(self, csv_file: str, df: pd.DataFrame, approved: bool, issues: List[str]):
         """Generate detailed approval report"""
         
         report_filename = f"approval_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
         report_path = os.path.join(self.output_dir, report_filename)
         
-        with open(report_path, 'w') as f:
-            f.write("BUDGET APPROVAL REPORT\n")
-            f.write("=" * 50 + "\n\n")
-            f.write(f"Source File: {csv_file}\n")
-            f.write(f"Analysis Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"Status: {'APPROVED' if approved else 'REJECTED'}\n\n")
-            
+        lines = [
+            "BUDGET APPROVAL REPORT\n",
+            "=" * 50 + "\n\n",
+            f"Source File: {csv_file}\n",
+            f"Analysis Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n",
+            f"Status: {'APPROVED' if approved else 'REJECTED'}\n\n",
             # Budget summary
-            f.write("BUDGET SUMMARY:\n")
-            f.write("-" * 20 + "\n")
-            f.write(f"Total Amount: {self.calculate_total_amount(df):,.0f}\n")
-            f.write(f"Total Items: {len(df)}\n")
-            f.write(f"Categories: {', '.join(df['Category'].unique())}\n\n")
-            
-            # Issues (if any)
-            if issues:
-                f.write("ISSUES IDENTIFIED:\n")
-                f.write("-" * 20 + "\n")
-                for i, issue in enumerate(issues, 1):
-                    f.write(f"{i}. {issue}\n")
-                f.write("\n")
-            
-            # Category breakdown
-            f.write("CATEGORY BREAKDOWN:\n")
-            f.write("-" * 20 + "\n")
-            category_summary = self.get_category_summary(df)
-            for _, row in category_summary.iterrows():
-                f.write(f"{row['Category']}: {row['Amount']:,.0f} ({row['Percentage']:.1f}%) - {row['Item_Count']} items\n")
+            "BUDGET SUMMARY:\n",
+            "-" * 20 + "\n",
+            f"Total Amount: {self.calculate_total_amount(df):,.0f}\n",
+            f"Total Items: {len(df)}\n",
+            f"Categories: {', '.join(df['Category'].unique())}\n\n",
+        ]
+        
+        # Issues (if any)
+        if issues:
+            lines.append("ISSUES IDENTIFIED:\n")
+            lines.append("-" * 20 + "\n")
+            lines.extend(f"{i}. {issue}\n" for i, issue in enumerate(issues, 1))
+            lines.append("\n")
+        
+        # Category breakdown
+        lines.append("CATEGORY BREAKDOWN:\n")
+        lines.append("-" * 20 + "\n")
+        category_summary = self.get_category_summary(df)
+        lines.extend(
+            f"{category}: {amount:,.0f} ({pct:.1f}%) - {count} items\n"
+            for category, amount, pct, count in category_summary.itertuples(index=False, name=None)
+        )
+        
+        # One write call for the whole report
+        with open(report_path, 'w', buffering=1 << 16) as f:
+            f.write(''.join(lines))
         
         print(f"Detailed report saved to '{report_path}'")
     
@@ -472,12 +673,14 @@ class BudgetApprovalSystem:
         print(f"\nBudget Overview:")
         print(f"File: {csv_file_path}")
         print(f"Total Items: {len(df)}")
-        print(f"Total Amount: {self.calculate_total_amount(df):,.0f}")
+        original_total = self.calculate_total_amount(df)
+        print(f"Total Amount: {original_total:,.0f}")
         print(f"Categories: {', '.join(df['Category'].unique())}")
         
         # Check approval rules
+        self._dirty = False
         is_approved, issues = self.check_approval_rules(df)
-        modified_df = df.copy()  # Default to original dataframe
+        modified_df = df  # Default to original dataframe (no copy until adjusted)
         
         if is_approved:
             print("\n✅ BUDGET AUTOMATICALLY APPROVED")
@@ -488,7 +691,7 @@ class BudgetApprovalSystem:
             is_approved, modified_df, notes = self.partial_approval_process(df, issues)
         
         # Save modified budget if changes were made
-        if not modified_df.equals(df) and is_approved:
+        if self._dirty and is_approved:
             self.display_approved_budget_summary(df, modified_df)
             self.save_approved_budget(csv_file_path, modified_df, notes)
         
@@ -500,7 +703,6 @@ class BudgetApprovalSystem:
         print(f"FINAL STATUS: {'✅ APPROVED' if is_approved else '❌ REJECTED'}")
         if is_approved:
             final_total = self.calculate_total_amount(modified_df)
-            original_total = self.calculate_total_amount(df)
             if final_total != original_total:
                 print(f"Original Amount: {original_total:,.0f}")
                 print(f"Approved Amount: {final_total:,.0f}")
@@ -529,22 +731,20 @@ class BudgetApprovalSystem:
         print(f"{'Item':<30} {'Category':<15} {'Original':>12} {'Approved':>12} {'Change':>12}")
         print("-" * 80)
         
-        for idx, row in approved_df.iterrows():
-            original_amount = row.get('Original_Amount', row['Amount'])
-            approved_amount = row['Amount']
-            change = approved_amount - original_amount
-            
-            change_indicator = ""
-            if change > 0:
-                change_indicator = "↗"
-            elif change < 0:
-                change_indicator = "↘"
-            elif approved_amount == 0:
-                change_indicator = "❌"
-            else:
-                change_indicator = "✓"
-            
-            print(f"{row['Name']:<30} {row['Category']:<15} {original_amount:>12,.0f} "
+        original_col = 'Original_Amount' if 'Original_Amount' in approved_df.columns else 'Amount'
+        original_amounts = approved_df[original_col].to_numpy(dtype=np.float64)
+        approved_amounts = approved_df['Amount'].to_numpy(dtype=np.float64)
+        changes = approved_amounts - original_amounts
+        indicators = np.select(
+            [changes > 0, changes < 0, approved_amounts == 0],
+            ["↗", "↘", "❌"],
+            default="✓"
+        )
+        
+        rows = zip(approved_df['Name'].tolist(), approved_df['Category'].tolist(), original_amounts.tolist(),
+                   approved_amounts.tolist(), changes.tolist(), indicators.tolist())
+        for name, category, original_amount, approved_amount, change, change_indicator in rows:
+            print(f"{name:<30} {category:<15} {original_amount:>12,.0f} "
                   f"{approved_amount:>12,.0f} {change:>+11,.0f} {change_indicator}")
         
         print("="*80)
@@ -555,161 +755,132 @@ class BudgetApprovalSystem:
         """
         # Generate approved budget filename base
         base_name = os.path.splitext(os.path.basename(original_file_path))[0]
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        # One clock read for the file names and both summaries
+        approved_at = datetime.now()
+        timestamp = approved_at.strftime('%Y%m%d_%H%M%S')
+        approval_ts = approved_at.strftime('%Y-%m-%d %H:%M:%S')
         
-        # Extract currency from the original formatted amount
-        currency_symbol = ""
+        # Currency of the original formatted amounts
+        currency_symbol = self._get_currency_symbol(approved_df)
         if len(approved_df) > 0 and 'Formatted Amount' in approved_df.columns:
-            original_formatted = approved_df.iloc[0]['Formatted Amount']
-            currency_symbol = ''.join([c for c in original_formatted if not c.isdigit() and c not in '.,'])
-            
             # Update formatted amounts
-            approved_df['Formatted Amount'] = approved_df['Amount'].apply(
-                lambda x: f"{currency_symbol}{x:,.0f}" if currency_symbol else f"{x:,.0f}"
-            )
+            approved_df['Formatted Amount'] = _format_amounts(approved_df['Amount'], currency_symbol)
+        
+        # Totals in one NumPy pass, reused by the Excel and text summaries
+        amounts = approved_df['Amount'].to_numpy(dtype=np.float64)
+        approved_total = float(np.nansum(amounts))
+        has_original = 'Original_Amount' in approved_df.columns
+        if has_original:
+            original_amounts = approved_df['Original_Amount'].to_numpy(dtype=np.float64)
+            original_amounts = np.where(np.isnan(original_amounts), amounts, original_amounts)
+            original_total = float(np.nansum(original_amounts))
+            net_change = approved_total - original_total
+            original_total_str = f"{currency_symbol}{original_total:,.0f}"
+            net_change_str = f"{_SIGN_PREFIX[(net_change > 0) - (net_change < 0)]}{currency_symbol}{net_change:,.0f}"
+        # Formatted once, shared by the Excel and text summaries
+        approved_total_str = f"{approved_total:,.0f}"
         
         # 1. Save CSV version
         approved_csv_filename = f"{base_name}_APPROVED_{timestamp}.csv"
         approved_csv_path = os.path.join(self.output_dir, approved_csv_filename)
+        # Only string and float64 columns are written, so pandas stays on its C writer
         approved_df.to_csv(approved_csv_path, index=False, 
-                          columns=['Category', 'Name', 'Formatted Amount', 'Percentage'])
+                          columns=['Category', 'Name', 'Formatted Amount', 'Percentage'],
+                          chunksize=50_000, lineterminator='\n')
         print(f"\n✅ Approved budget (CSV) saved to: '{approved_csv_path}'")
         
         # 2. Save Excel version with professional formatting
-        try:
-            approved_excel_filename = f"{base_name}_APPROVED_REPORT_{timestamp}.xlsx"
-            approved_excel_path = os.path.join(self.output_dir, approved_excel_filename)
-            
-            # Create neat column mapping for professional reports
-            column_mapping = {
-                'Category': 'Budget Category',
-                'Name': 'Item Description',
-                'Formatted Amount': f'Approved Amount',
-                'Percentage': 'Percentage (%)',
-                'Original_Amount': 'Original Amount (Numeric)'
-            }
-            
-            # Prepare export dataframe
-            export_cols = ['Category', 'Name', 'Formatted Amount', 'Percentage']
-            if 'Original_Amount' in approved_df.columns:
-                # Add comparison column if there were modifications
-                approved_df['Change'] = approved_df['Amount'] - approved_df['Original_Amount'].fillna(approved_df['Amount'])
-                approved_df['Change_Formatted'] = approved_df['Change'].apply(
-                    lambda x: f"{'+' if x > 0 else ''}{currency_symbol}{x:,.0f}" if x != 0 else "-"
-                )
-                export_cols.extend(['Change_Formatted'])
-                column_mapping['Change_Formatted'] = 'Amount Change'
-            
-            df_export = approved_df[export_cols].copy()
-            df_export = df_export.rename(columns=column_mapping)
-            
-            # Export with formatting using openpyxl
-            with pd.ExcelWriter(approved_excel_path, engine='openpyxl') as writer:
-                df_export.to_excel(writer, sheet_name='Approved Budget', index=False)
-                
-                # Get workbook and worksheet for formatting
-                workbook = writer.book
-                worksheet = writer.sheets['Approved Budget']
-                
-                # Import styling modules
-                from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-                
-                # Header formatting
-                header_fill = PatternFill(start_color='366092', end_color='366092', fill_type='solid')
-                header_font = Font(bold=True, color='FFFFFF', size=11)
+        if len(approved_df) == 0:
+            # Nothing to tabulate; skip the workbook import and serialization
+            print("\n⚠️ No approved items. Excel export skipped.")
+        else:
+            try:
+                approved_excel_filename = f"{base_name}_APPROVED_REPORT_{timestamp}.xlsx"
+                approved_excel_path = os.path.join(self.output_dir, approved_excel_filename)
                 
-                for col_idx, col in enumerate(df_export.columns, 1):
-                    # Format header
-                    cell = worksheet.cell(row=1, column=col_idx)
-                    cell.fill = header_fill
-                    cell.font = header_font
-                    cell.alignment = Alignment(horizontal='center', vertical='center')
-                    
-                    # Auto-adjust column width
-                    max_length = max(
-                        df_export[col].astype(str).apply(len).max(),
-                        len(col)
-                    ) + 2
-                    column_letter = cell.column_letter
-                    worksheet.column_dimensions[column_letter].width = min(max_length, 50)
+                # Create neat column mapping for professional reports
+                column_mapping = {
+                    'Category': 'Budget Category',
+                    'Name': 'Item Description',
+                    'Formatted Amount': f'Approved Amount',
+                    'Percentage': 'Percentage (%)',
+                    'Original_Amount': 'Original Amount (Numeric)'
+                }
                 
-                # Add borders to all cells
-                thin_border = Border(
-                    left=Side(style='thin'),
-                    right=Side(style='thin'),
-                    top=Side(style='thin'),
-                    bottom=Side(style='thin')
-                )
+                # Prepare export dataframe
+                export_cols = ['Category', 'Name', 'Formatted Amount', 'Percentage']
+                if has_original:
+                    # Add comparison column if there were modifications
+                    change = amounts - original_amounts
+                    approved_df['Change'] = change
+                    signs = np.where(change > 0, '+', '')
+                    approved_df['Change_Formatted'] = np.where(
+                        change == 0, "-",
+                        [f"{sign}{currency_symbol}{value:,.0f}" for sign, value in zip(signs.tolist(), change.tolist())]
+                    )
+                    export_cols.extend(['Change_Formatted'])
+                    column_mapping['Change_Formatted'] = 'Amount Change'
                 
-                for row in worksheet.iter_rows(min_row=1, max_row=len(df_export)+1, 
-                                              min_col=1, max_col=len(df_export.columns)):
-                    for cell in row:
-                        cell.border = thin_border
-                        if cell.row > 1:  # Data rows
-                            cell.alignment = Alignment(horizontal='left', vertical='center')
+                df_export = approved_df[export_cols].copy()
+                df_export = df_export.rename(columns=column_mapping)
                 
-                # Add summary information at the bottom
-                summary_row = len(df_export) + 3
-                worksheet.cell(row=summary_row, column=1, value="Approval Summary")
-                worksheet.cell(row=summary_row, column=1).font = Font(bold=True, size=12)
+                # Summary information written below the table
+                summary_rows = [
+                    ("Total Approved Amount:", f"{currency_symbol}{approved_total_str}"),
+                    ("Approval Date:", approval_ts),
+                ]
+                if has_original:
+                    summary_rows.append(("Original Amount:", original_total_str))
+                    summary_rows.append(("Net Change:", net_change_str))
                 
-                worksheet.cell(row=summary_row+1, column=1, value="Total Approved Amount:")
-                worksheet.cell(row=summary_row+1, column=2, 
-                             value=f"{currency_symbol}{self.calculate_total_amount(approved_df):,.0f}")
+                write_excel_report(approved_excel_path, df_export, sheet_name='Approved Budget',
+                                   summary=summary_rows, summary_title='Approval Summary')
                 
-                worksheet.cell(row=summary_row+2, column=1, value="Approval Date:")
-                worksheet.cell(row=summary_row+2, column=2, 
-                             value=datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+                print(f"✅ Approved budget (Excel Report) saved to: '{approved_excel_path}'")
+                print(f"   Format: Professional report with neat column titles and formatting")
                 
-                if 'Original_Amount' in approved_df.columns:
-                    original_total = approved_df['Original_Amount'].fillna(approved_df['Amount']).sum()
-                    approved_total = self.calculate_total_amount(approved_df)
-                    change = approved_total - original_total
-                    
-                    worksheet.cell(row=summary_row+3, column=1, value="Original Amount:")
-                    worksheet.cell(row=summary_row+3, column=2, 
-                                 value=f"{currency_symbol}{original_total:,.0f}")
-                    
-                    worksheet.cell(row=summary_row+4, column=1, value="Net Change:")
-                    worksheet.cell(row=summary_row+4, column=2, 
-                                 value=f"{'+' if change > 0 else ''}{currency_symbol}{change:,.0f}")
+            except ImportError:
+                print("\n⚠️ openpyxl not installed. Excel export skipped. Install with: pip install openpyxl")
+            except Exception as e:
+                print(f"\n⚠️ Excel export failed: {str(e)}. CSV version is available.")
             
-            print(f"✅ Approved budget (Excel Report) saved to: '{approved_excel_path}'")
-            print(f"   Format: Professional report with neat column titles and formatting")
-            
-        except ImportError:
-            print("\n⚠️ openpyxl not installed. Excel export skipped. Install with: pip install openpyxl")
-        except Exception as e:
-            print(f"\n⚠️ Excel export failed: {str(e)}. CSV version is available.")
-        
         # 3. Save approval summary (text file)
         summary_filename = f"{base_name}_APPROVAL_SUMMARY_{timestamp}.txt"
         summary_file_path = os.path.join(self.output_dir, summary_filename)
         
-        with open(summary_file_path, 'w') as f:
-            f.write("BUDGET APPROVAL SUMMARY\n")
-            f.write("=" * 50 + "\n\n")
-            f.write(f"Original File: {original_file_path}\n")
-            f.write(f"Approved CSV: {approved_csv_path}\n")
-            f.write(f"Approval Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"Total Approved Amount: {self.calculate_total_amount(approved_df):,.0f}\n\n")
-            f.write(f"Approval Notes: {notes}\n\n")
-            
-            # Show changes if any
-            if 'Original_Amount' in approved_df.columns:
-                f.write("AMOUNT MODIFICATIONS:\n")
-                f.write("-" * 30 + "\n")
-                for _, row in approved_df.iterrows():
-                    if pd.notna(row.get('Original_Amount')) and row['Original_Amount'] != row['Amount']:
-                        f.write(f"{row['Name']}: {row['Original_Amount']:,.0f} → {row['Amount']:,.0f}\n")
+        parts = [
+            "BUDGET APPROVAL SUMMARY\n",
+            "=" * 50 + "\n\n",
+            f"Original File: {original_file_path}\n",
+            f"Approved CSV: {approved_csv_path}\n",
+            f"Approval Date: {approval_ts}\n",
+            f"Total Approved Amount: {approved_total_str}\n\n",
+            f"Approval Notes: {notes}\n\n",
+        ]
+        
+        # Show changes if any
+        if has_original:
+            parts.append("AMOUNT MODIFICATIONS:\n")
+            parts.append("-" * 30 + "\n")
+            # Missing originals were filled with the approved amount, so they never match
+            modified = original_amounts != amounts
+            names = approved_df['Name'].to_numpy()[modified].tolist()
+            parts.extend(
+                f"{name}: {original_amount:,.0f} → {amount:,.0f}\n"
+                for name, original_amount, amount in zip(
+                    names, original_amounts[modified].tolist(), amounts[modified].tolist()
+                )
+            )
+        
+        # One write call for the whole summary
+        with open(summary_file_path, 'w', buffering=1 << 16) as f:
+            f.write(''.join(parts))
         
         print(f"✅ Approval summary saved to: '{summary_file_path}'")
 
 
 def main():
     """Main function to run budget approval system"""
-    approval_system = BudgetApprovalSystem()
-    
     print("Budget Approval System")
     print("=" * 30)
     
@@ -719,13 +890,17 @@ def main():
         print(f"No '{output_dir}' directory found. Please run main.py first to create budgets.")
         return
     
-    csv_files = [f for f in os.listdir(output_dir) if f.endswith('.csv')]
+    with os.scandir(output_dir) as entries:
+        csv_files = sorted(entry.name for entry in entries if entry.name.endswith('.csv') and entry.is_file())
     
     if not csv_files:
         print(f"No CSV files found in '{output_dir}' directory.")
         print("Please run main.py first to create a budget.")
         return
     
+    # Created after the directory check: the constructor creates output/ itself
+    approval_system = BudgetApprovalSystem()
+    
     print("\nAvailable budget files:")
     for i, file in enumerate(csv_files, 1):
         print(f"{i}. {file}")
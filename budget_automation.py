@@ -1,70 +1,129 @@
-import pandas as pd
 import os
 import sys
 from datetime import datetime
+from importlib.util import find_spec
 
-# Import budget approval system
-try:
-    from budget_approval import BudgetApprovalSystem
-    APPROVAL_SYSTEM_AVAILABLE = True
-except ImportError:
+# pandas, pyarrow and the approval system are imported on first use, so the
+# prompts appear immediately; these checks only locate the modules
+APPROVAL_SYSTEM_AVAILABLE = find_spec("budget_approval") is not None
+if not APPROVAL_SYSTEM_AVAILABLE:
     print("Warning: budget_approval.py not found. Approval system will be disabled.")
-    APPROVAL_SYSTEM_AVAILABLE = False
+
+# XlsxWriter streams worksheets straight to XML and applies formats per column;
+# like pyarrow it is only located here and imported by the writer that uses it
+XLSXWRITER_AVAILABLE = find_spec("xlsxwriter") is not None
+
+# Arrow-backed strings keep Category/Name in contiguous buffers
+PYARROW_AVAILABLE = find_spec("pyarrow") is not None
+
+# Display symbols per currency code, built once at import
+CURRENCY_SYMBOLS = {
+    "IDR": "Rp",
+    "USD": "$",
+    "EUR": "€",
+    "JPY": "¥"
+    # Add more if needed
+}
+
+# Columns written to budget CSVs (the layout budget_approval.py reads)
+BUDGET_CSV_COLUMNS = ['Category', 'Name', 'Formatted Amount', 'Percentage']
+
+def currency_symbol(currency):
+    """Return the display symbol for a currency code (code plus a space if unknown)"""
+    return CURRENCY_SYMBOLS.get(currency.upper(), currency + " ")
 
 def format_currency(amount, currency):
     """Format amount with currency symbol and comma separator"""
-    symbols = {
-        "IDR": "Rp",
-        "USD": "$",
-        "EUR": "€",
-        "JPY": "¥"
-        # Add more if needed
-    }
-    symbol = symbols.get(currency.upper(), currency + " ")
-    return f"{symbol}{float(amount):,.0f}"
+    return f"{currency_symbol(currency)}{float(amount):,.0f}"
+
+def _parse_amount(value):
+    """Amount as float, or NaN if it is not a number"""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float('nan')
+
+def top_n_positions(amounts, n):
+    """
+    Positions of the n largest amounts, largest first, ties in row order (matches nlargest);
+    missing amounts are skipped
+    """
+    import numpy as np
+    
+    values = amounts.to_numpy(dtype=np.float64)
+    valid = np.flatnonzero(~np.isnan(values))
+    k = min(n, len(valid))
+    if not k:
+        return valid
+    # O(N) selection of the k-th largest value instead of a full sort
+    kth = np.partition(values[valid], -k)[-k]
+    above = valid[values[valid] > kth]
+    ties = valid[values[valid] == kth][:k - len(above)]
+    top = np.concatenate([above, ties])
+    return top[np.argsort(-values[top], kind='stable')]
 
-def create_budget(currency, entries):
+def create_budget(currency, entries, validated=False):
     """
     Create a budget DataFrame with percentage breakdown and formatted currency amounts.
     :param currency: str, currency code (e.g. 'IDR', 'USD')
     :param entries: list of dicts with 'Category', 'Name', and 'Amount'
+    :param validated: bool, True when every 'Amount' is already a float (skips re-parsing)
     :return: pandas DataFrame
     """
-    df = pd.DataFrame(entries)
-    df['Amount'] = pd.to_numeric(df['Amount'], errors='coerce')
+    import pandas as pd
+    
+    # Parse and validate in plain Python, then build the DataFrame in one shot
+    if validated:
+        amounts = [entry['Amount'] for entry in entries]
+        valid = list(range(len(entries)))
+    else:
+        amounts = [_parse_amount(entry.get('Amount')) for entry in entries]
+        valid = [i for i, amount in enumerate(amounts) if amount == amount]  # NaN != NaN
     
     # Check for invalid amounts (NaN values)
-    if df['Amount'].isna().any():
-        invalid_entries = df[df['Amount'].isna()]['Name'].tolist()
+    if len(valid) < len(entries):
+        invalid_entries = [str(entries[i].get('Name')) for i, amount in enumerate(amounts) if amount != amount]
         print(f"Warning: Invalid amounts detected for: {', '.join(invalid_entries)}")
         print("These entries will be excluded from calculations.")
-        df = df.dropna(subset=['Amount'])
     
-    if df.empty:
+    if not valid:
         print("Error: No valid budget entries found.")
         return pd.DataFrame()
     
-    total = df['Amount'].sum()
-    df['Percentage'] = round((df['Amount'] / total) * 100, 2)
-    df['Formatted Amount'] = df.apply(lambda row: format_currency(row['Amount'], currency), axis=1)
+    valid_amounts = [amounts[i] for i in valid]
+    total = sum(valid_amounts)
+    # Symbol resolved once; one pass over the amounts instead of a row-wise apply
+    symbol = currency_symbol(currency)
+    
+    df = pd.DataFrame([entries[i] for i in valid], index=valid)
+    df['Amount'] = valid_amounts
+    if PYARROW_AVAILABLE:
+        df = df.astype({'Category': 'string[pyarrow]', 'Name': 'string[pyarrow]'})
+    # One reciprocal, then a vectorized multiply and round (an all-zero budget has no shares)
+    scale = 100.0 / total if total else float('nan')
+    df['Percentage'] = (df['Amount'] * scale).round(2)
+    df['Formatted Amount'] = [f"{symbol}{amount:,.0f}" for amount in valid_amounts]
 
     print(f"\nTotal Budget: {format_currency(total, currency)}\n")
     print(f"Created on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
     print("Budget Breakdown:")
+    print(f"{'Category':<15} {'Name':<20} {'Amount':>15} {'Share':>7}")
     print("-" * 60)
-    print(df[['Category', 'Name', 'Formatted Amount', 'Percentage']])
+    for category, name, formatted, pct in df[['Category', 'Name', 'Formatted Amount', 'Percentage']].itertuples(index=False, name=None):
+        print(f"{category:<15} {name:<20} {formatted:>15} {pct:>6.2f}%")
 
     return df
 
 
-def save_budget_to_csv(budget_df, currency):
+def save_budget_to_csv(budget_df, currency, timestamp=None):
     """
     Save budget DataFrame to CSV file with enhanced naming
     """
     os.makedirs("output", exist_ok=True)
     
     # Generate default filename with timestamp
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    if timestamp is None:
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     default_filename = f"budget_{currency.lower()}_{timestamp}.csv"
     
     print(f"\nDefault filename: {default_filename}")
@@ -78,13 +137,227 @@ def save_budget_to_csv(budget_df, currency):
         file_name = default_filename
     
     file_path = os.path.join("output", file_name)
-    budget_df.to_csv(file_path, index=False, columns=['Category', 'Name', 'Formatted Amount', 'Percentage'])
+    budget_df.to_csv(file_path, index=False, columns=BUDGET_CSV_COLUMNS)
     print(f"\nBudget saved to '{file_path}' successfully!")
     
     return file_path
 
 
-def export_to_excel(budget_df, currency, include_approval_columns=False):
+# Display format and width for date/time cells in the Excel reports
+EXCEL_DATE_FORMAT = 'yyyy-mm-dd hh:mm:ss'
+EXCEL_DATE_WIDTH = len('2024-01-01 00:00:00')
+
+
+def _date_columns(df_export):
+    """Positions of the datetime columns, which need a date number format"""
+    from pandas.api.types import is_datetime64_any_dtype
+    return {idx for idx, dtype in enumerate(df_export.dtypes) if is_datetime64_any_dtype(dtype)}
+
+
+def _write_excel_xlsxwriter(file_path, headers, rows, column_widths, date_columns, sheet_name, summary,
+                            summary_title):
+    """
+    Write the budget report with XlsxWriter, styling whole columns and rows at once
+    """
+    import xlsxwriter
+    
+    workbook = xlsxwriter.Workbook(file_path, {'constant_memory': True, 'strings_to_numbers': False})
+    try:
+        worksheet = workbook.add_worksheet(sheet_name)
+        
+        header_fmt = workbook.add_format({
+            'bold': True, 'font_color': '#FFFFFF', 'font_size': 11, 'bg_color': '#366092',
+            'align': 'center', 'valign': 'vcenter', 'border': 1
+        })
+        body_fmt = workbook.add_format({'align': 'left', 'valign': 'vcenter', 'border': 1})
+        date_fmt = workbook.add_format({
+            'align': 'left', 'valign': 'vcenter', 'border': 1, 'num_format': EXCEL_DATE_FORMAT
+        })
+        row_fmts = [date_fmt if idx in date_columns else body_fmt for idx in range(len(headers))]
+        
+        for col_idx, width in enumerate(column_widths):
+            worksheet.set_column(col_idx, col_idx, width)
+        
+        # Rows must be written in order: constant_memory flushes each finished row
+        worksheet.write_row(0, 0, headers, header_fmt)
+        row_idx = 0
+        if date_columns:
+            for row_idx, row in enumerate(rows, start=1):
+                for col_idx, (value, fmt) in enumerate(zip(row, row_fmts)):
+                    worksheet.write(row_idx, col_idx, value, fmt)
+        else:
+            for row_idx, row in enumerate(rows, start=1):
+                worksheet.write_row(row_idx, 0, row, body_fmt)
+        
+        if summary:
+            # One blank row, then the bold title and unstyled label/value rows
+            summary_row = row_idx + 2
+            worksheet.write(summary_row, 0, summary_title, workbook.add_format({'bold': True, 'font_size': 12}))
+            for offset, (label, value) in enumerate(summary, start=1):
+                worksheet.write_row(summary_row + offset, 0, [label, value])
+    finally:
+        workbook.close()
+
+
+_OPENPYXL_STYLES = {}
+
+
+def openpyxl_styles():
+    """
+    Return the shared openpyxl style objects, built on first use
+    """
+    if not _OPENPYXL_STYLES:
+        from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+        thin = Side(style='thin')
+        _OPENPYXL_STYLES.update(
+            header_font=Font(bold=True, color='FFFFFF', size=11),
+            header_fill=PatternFill(start_color='366092', end_color='366092', fill_type='solid'),
+            header_alignment=Alignment(horizontal='center', vertical='center'),
+            body_alignment=Alignment(horizontal='left', vertical='center'),
+            border=Border(left=thin, right=thin, top=thin, bottom=thin),
+            title_font=Font(bold=True, size=12),
+        )
+    return _OPENPYXL_STYLES
+
+
+def _write_excel_openpyxl(file_path, headers, rows, column_widths, date_columns, sheet_name, summary,
+                          summary_title):
+    """
+    Stream the budget report through a write-only openpyxl workbook
+    """
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import NamedStyle
+    from openpyxl.utils import get_column_letter
+    
+    styles = openpyxl_styles()
+    workbook = Workbook(write_only=True)
+    worksheet = workbook.create_sheet(title=sheet_name)
+    
+    # Registered once per workbook; cells then share a single style record
+    workbook.add_named_style(NamedStyle(
+        name='budget_header',
+        font=styles['header_font'],
+        fill=styles['header_fill'],
+        alignment=styles['header_alignment'],
+        border=styles['border']
+    ))
+    workbook.add_named_style(NamedStyle(
+        name='budget_body',
+        alignment=styles['body_alignment'],
+        border=styles['border']
+    ))
+    workbook.add_named_style(NamedStyle(
+        name='budget_date',
+        alignment=styles['body_alignment'],
+        border=styles['border'],
+        number_format=EXCEL_DATE_FORMAT
+    ))
+    
+    # Column widths must be set before the first row is streamed
+    for col_idx, width in enumerate(column_widths, 1):
+        worksheet.column_dimensions[get_column_letter(col_idx)].width = width
+    
+    def styled_row(values, row_styles):
+        cells = []
+        for value, style in zip(values, row_styles):
+            cell = WriteOnlyCell(worksheet, value=value)
+            cell.style = style
+            cells.append(cell)
+        return cells
+    
+    ncols = len(headers)
+    body_styles = ['budget_date' if idx in date_columns else 'budget_body' for idx in range(ncols)]
+    worksheet.append(styled_row(headers, ['budget_header'] * ncols))
+    for row in rows:
+        worksheet.append(styled_row(row, body_styles))
+    
+    if summary:
+        # One blank row, then the bold title and unstyled label/value rows
+        title = WriteOnlyCell(worksheet, value=summary_title)
+        title.font = styles['title_font']
+        worksheet.append([])
+        worksheet.append([title])
+        for label, value in summary:
+            worksheet.append([label, value])
+    
+    workbook.save(file_path)
+
+
+def excel_column_widths(df_export, max_width=50):
+    """
+    Column widths fitting the longest cell or header, capped at max_width
+    """
+    # Vectorized string lengths over one string copy of the frame. Missing cells
+    # have no length, so an all-missing column is sized by its header
+    if len(df_export):
+        longest = df_export.astype(str).apply(lambda col: col.str.len().max()).fillna(0).tolist()
+    else:
+        longest = [0] * len(df_export.columns)
+    # Dates are displayed in EXCEL_DATE_FORMAT, not their string form
+    for idx in _date_columns(df_export):
+        longest[idx] = EXCEL_DATE_WIDTH
+    return [min(max(int(length), len(str(col))) + 2, max_width)
+            for col, length in zip(df_export.columns, longest)]
+
+
+def row_column_widths(headers, rows, max_width=50):
+    """
+    Column widths and date column positions for plain row tuples (None for empty cells),
+    the row counterpart of excel_column_widths
+    """
+    longest = [len(str(title)) for title in headers]
+    date_columns = set()
+    # Running maxima over str(value); widths are capped with 2 characters of padding,
+    # so a column stops being measured once it reaches max_width - 2
+    for row in rows:
+        for idx, value in enumerate(row):
+            if isinstance(value, datetime):
+                date_columns.add(idx)
+                length = EXCEL_DATE_WIDTH
+            elif value is not None and longest[idx] < max_width - 2:
+                length = len(str(value))
+            else:
+                continue
+            if length > longest[idx]:
+                longest[idx] = length
+    return [min(length + 2, max_width) for length in longest], date_columns
+
+
+def _write_excel(file_path, headers, rows, column_widths, date_columns, sheet_name, summary, summary_title):
+    """Dispatch to the XlsxWriter or openpyxl report writer"""
+    writer = _write_excel_xlsxwriter if XLSXWRITER_AVAILABLE else _write_excel_openpyxl
+    writer(file_path, headers, rows, column_widths, date_columns, sheet_name, summary, summary_title)
+
+
+def write_excel_report(file_path, df_export, sheet_name='Budget Report', summary=None,
+                       summary_title='Budget Summary'):
+    """
+    Write a styled Excel report: bold header, bordered rows, fitted column widths
+    and an optional summary block (summary_title, then (label, value) rows) below the table
+    """
+    column_widths = excel_column_widths(df_export)
+    
+    # Raw tuples go straight to the writer; only frames with gaps need the NaN -> None pass
+    rows = df_export.itertuples(index=False, name=None)
+    if df_export.isna().to_numpy().any():
+        import pandas as pd
+        rows = ([None if pd.isna(value) else value for value in row] for row in rows)
+    
+    _write_excel(file_path, list(df_export.columns), rows, column_widths, _date_columns(df_export),
+                 sheet_name, summary, summary_title)
+
+
+def write_excel_rows(file_path, headers, rows, sheet_name='Budget Report', summary=None,
+                     summary_title='Budget Summary'):
+    """
+    write_excel_report for plain row tuples (None for empty cells), without pandas
+    """
+    column_widths, date_columns = row_column_widths(headers, rows)
+    _write_excel(file_path, list(headers), rows, column_widths, date_columns, sheet_name, summary, summary_title)
+
+
+def export_to_excel(budget_df, currency, include_approval_columns=False, timestamp=None):
     """
     Export budget to Excel with professional formatting and neat column titles
     Perfect for reports and presentations
@@ -92,7 +365,8 @@ def export_to_excel(budget_df, currency, include_approval_columns=False):
     os.makedirs("output", exist_ok=True)
     
     # Generate default filename with timestamp
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    if timestamp is None:
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     default_filename = f"budget_report_{currency.lower()}_{timestamp}.xlsx"
     
     print(f"\n{'='*60}")
@@ -143,49 +417,7 @@ def export_to_excel(budget_df, currency, include_approval_columns=False):
     
     # Export with formatting
     try:
-        with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
-            df_export.to_excel(writer, sheet_name='Budget Report', index=False)
-            
-            # Get worksheet for formatting
-            worksheet = writer.sheets['Budget Report']
-            
-            # Auto-adjust column widths
-            from openpyxl.styles import Font, PatternFill, Alignment
-            
-            # Header formatting
-            header_fill = PatternFill(start_color='366092', end_color='366092', fill_type='solid')
-            header_font = Font(bold=True, color='FFFFFF', size=11)
-            
-            for col_idx, col in enumerate(df_export.columns, 1):
-                # Format header
-                cell = worksheet.cell(row=1, column=col_idx)
-                cell.fill = header_fill
-                cell.font = header_font
-                cell.alignment = Alignment(horizontal='center', vertical='center')
-                
-                # Auto-adjust column width
-                max_length = max(
-                    df_export[col].astype(str).apply(len).max(),
-                    len(col)
-                ) + 2
-                column_letter = worksheet.cell(row=1, column=col_idx).column_letter
-                worksheet.column_dimensions[column_letter].width = min(max_length, 50)
-            
-            # Add border to all cells
-            from openpyxl.styles import Border, Side
-            thin_border = Border(
-                left=Side(style='thin'),
-                right=Side(style='thin'),
-                top=Side(style='thin'),
-                bottom=Side(style='thin')
-            )
-            
-            for row in worksheet.iter_rows(min_row=1, max_row=len(df_export)+1, 
-                                          min_col=1, max_col=len(df_export.columns)):
-                for cell in row:
-                    cell.border = thin_border
-                    if cell.row > 1:  # Data rows
-                        cell.alignment = Alignment(horizontal='left', vertical='center')
+        write_excel_report(file_path, df_export)
         
         print("\n✅ Excel report exported successfully!")
         print("   Location: '{}'" .format(file_path))
@@ -217,6 +449,7 @@ def run_approval_process(csv_file_path):
     print("="*60)
     
     try:
+        from budget_approval import BudgetApprovalSystem
         approval_system = BudgetApprovalSystem()
         approval_system.process_budget_approval(csv_file_path)
     except Exception as e:
@@ -241,6 +474,7 @@ def main():
         print(f"Invalid currency. Please choose from: {', '.join(valid_currencies)}")
 
     # Collect budget entries
+    symbol = currency_symbol(currency_input)
     budget_items = []
     print(f"\nEnter budget items (currency: {currency_input})")
     print("Type 'done' when finished entering items")
@@ -265,21 +499,23 @@ def main():
                 if not amount:
                     print("Amount cannot be empty. Please try again.")
                     continue
-                # Test if it's a valid number
-                float(amount)
+                # Parse once; the float is stored with the entry
+                amount = float(amount)
+                if amount != amount:  # 'nan' parses but is not an amount
+                    raise ValueError(amount)
                 break
             except ValueError:
                 print("Please enter a valid number.")
         
         budget_items.append({'Category': category, 'Name': name, 'Amount': amount})
-        print(f"✓ Added: {name} - {format_currency(float(amount), currency_input)}")
+        print(f"✓ Added: {name} - {symbol}{amount:,.0f}")
 
     if not budget_items:
         print("No budget items entered. Exiting.")
         return
 
     # Generate and display budget
-    budget_df = create_budget(currency_input, budget_items)
+    budget_df = create_budget(currency_input, budget_items, validated=True)
 
     # Only proceed with export if we have valid data
     if not budget_df.empty:
@@ -295,28 +531,27 @@ def main():
         
         csv_file_path = None
         excel_file_path = None
+        # One timestamp names every file written by this export
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         
         if export_choice in ['1', '3']:
-            csv_file_path = save_budget_to_csv(budget_df, currency_input)
+            csv_file_path = save_budget_to_csv(budget_df, currency_input, timestamp)
         
         if export_choice in ['2', '3']:
-            excel_file_path = export_to_excel(budget_df, currency_input)
+            excel_file_path = export_to_excel(budget_df, currency_input, timestamp=timestamp)
             
         if export_choice not in ['1', '2', '3']:
             print("Invalid choice. Defaulting to CSV export...")
-            csv_file_path = save_budget_to_csv(budget_df, currency_input)
-        
-        # Use CSV path for approval process (if Excel only, save temp CSV)
-        if csv_file_path is None and excel_file_path:
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            csv_file_path = os.path.join("output", f"temp_budget_{timestamp}.csv")
-            budget_df.to_csv(csv_file_path, index=False, 
-                           columns=['Category', 'Name', 'Formatted Amount', 'Percentage'])
+            csv_file_path = save_budget_to_csv(budget_df, currency_input, timestamp)
         
         # Ask if user wants to run approval process
-        if APPROVAL_SYSTEM_AVAILABLE and csv_file_path:
+        if APPROVAL_SYSTEM_AVAILABLE and (csv_file_path or excel_file_path):
             run_approval = input("\nWould you like to run the approval process? (y/n): ").strip().lower()
             if run_approval in ['y', 'yes']:
+                # Approval reads a CSV; for Excel-only exports write one now, only when it is needed
+                if csv_file_path is None:
+                    csv_file_path = os.path.join("output", f"temp_budget_{timestamp}.csv")
+                    budget_df.to_csv(csv_file_path, index=False, columns=BUDGET_CSV_COLUMNS)
                 run_approval_process(csv_file_path)
             else:
                 print("Budget saved. You can run approval later using budget_approval.py")
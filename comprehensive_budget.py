@@ -7,6 +7,7 @@ Integrates seamlessly with the existing workflow
 
 import os
 import sys
+import numpy as np
 import pandas as pd
 from datetime import datetime
 from budget_templates import (
@@ -18,7 +19,9 @@ from budget_templates import (
 
 # Import from existing budget_automation for compatibility
 try:
-    from budget_automation import format_currency, export_to_excel, APPROVAL_SYSTEM_AVAILABLE
+    from budget_automation import (
+        currency_symbol, format_currency, export_to_excel, write_excel_report, APPROVAL_SYSTEM_AVAILABLE
+    )
     if APPROVAL_SYSTEM_AVAILABLE:
         from budget_approval import BudgetApprovalSystem
 except ImportError:
@@ -41,12 +44,10 @@ class ComprehensiveBudgetCreator:
         """Select currency for budget"""
         valid_currencies = ["IDR", "USD", "EUR", "JPY", "GBP", "AUD", "CAD", "SGD"]
         
-        print("\n" + "="*60)
-        print("SELECT CURRENCY")
-        print("="*60)
-        print("Available currencies:")
-        for i, curr in enumerate(valid_currencies, 1):
-            print(f"{i}. {curr}")
+        # Static menus are joined and written in one print call
+        menu = ["\n" + "="*60, "SELECT CURRENCY", "="*60, "Available currencies:"]
+        menu.extend(f"{i}. {curr}" for i, curr in enumerate(valid_currencies, 1))
+        print("\n".join(menu))
         
         while True:
             choice = input(f"\nEnter currency code or number (1-{len(valid_currencies)}): ").strip().upper()
@@ -66,16 +67,13 @@ class ComprehensiveBudgetCreator:
     
     def select_budget_type(self):
         """Select budget type/template"""
-        print("\n" + "="*60)
-        print("SELECT BUDGET TYPE")
-        print("="*60)
-        
         templates = BudgetTemplates.list_available_templates()
         template_keys = list(templates.keys())
         
-        for i, (key, description) in enumerate(templates.items(), 1):
-            print(f"{i}. {key.upper()}: {description}")
-        print(f"{len(templates) + 1}. CUSTOM: Start from scratch")
+        menu = ["\n" + "="*60, "SELECT BUDGET TYPE", "="*60]
+        menu.extend(f"{i}. {key.upper()}: {description}" for i, (key, description) in enumerate(templates.items(), 1))
+        menu.append(f"{len(templates) + 1}. CUSTOM: Start from scratch")
+        print("\n".join(menu))
         
         while True:
             choice = input(f"\nSelect budget type (1-{len(templates) + 1}): ").strip()
@@ -101,15 +99,19 @@ class ComprehensiveBudgetCreator:
             print("Error: Could not load template")
             return False
         
-        print(f"\n✓ Loaded {len(template_items)} template items")
-        print("\n" + "="*60)
-        print("FILL TEMPLATE")
-        print("="*60)
-        print("Enter amounts for each item (press Enter to skip with $0)")
-        print("You can add custom items after completing the template")
-        print("-" * 60)
+        print("\n".join([
+            f"\n✓ Loaded {len(template_items)} template items",
+            "\n" + "="*60,
+            "FILL TEMPLATE",
+            "="*60,
+            "Enter amounts for each item (press Enter to skip with $0)",
+            "You can add custom items after completing the template",
+            "-" * 60,
+        ]))
         
         filled_items = []
+        total = 0.0
+        symbol = currency_symbol(self.currency)
         
         current_category = None
         for item in template_items:
@@ -146,14 +148,14 @@ class ComprehensiveBudgetCreator:
                     'Amount': amount,
                     'Priority': priority
                 })
-                print(f"    ✓ Added: {format_currency(amount, self.currency)}")
+                total += amount
+                print(f"    ✓ Added: {symbol}{amount:,.0f}")
         
         self.budget_items = filled_items
         
         # Show summary
         if filled_items:
-            total = sum(item['Amount'] for item in filled_items)
-            print(f"\n✓ Template filled: {len(filled_items)} items, Total: {format_currency(total, self.currency)}")
+            print(f"\n✓ Template filled: {len(filled_items)} items, Total: {symbol}{total:,.0f}")
             
             # Option to add more items
             add_more = input("\nWould you like to add custom items? (y/n): ").strip().lower()
@@ -167,11 +169,8 @@ class ComprehensiveBudgetCreator:
     
     def add_custom_items(self):
         """Add custom budget items"""
-        print("\n" + "="*60)
-        print("ADD CUSTOM ITEMS")
-        print("="*60)
-        print("Type 'done' when finished")
-        print("-" * 60)
+        print("\n".join(["\n" + "="*60, "ADD CUSTOM ITEMS", "="*60, "Type 'done' when finished", "-" * 60]))
+        symbol = currency_symbol(self.currency)
         
         while True:
             category = input("\nCategory (or 'done'): ").strip()
@@ -207,7 +206,7 @@ class ComprehensiveBudgetCreator:
                 'Priority': priority
             })
             
-            print(f"✓ Added: {name} - {format_currency(amount, self.currency)}")
+            print(f"✓ Added: {name} - {symbol}{amount:,.0f}")
     
     def create_budget_dataframe(self):
         """Convert budget items to DataFrame with calculations"""
@@ -215,21 +214,25 @@ class ComprehensiveBudgetCreator:
             print("No budget items to process")
             return None
         
-        df = pd.DataFrame(self.budget_items)
-        df['Amount'] = pd.to_numeric(df['Amount'], errors='coerce').fillna(0)
+        # Amounts are validated floats on entry, so build the columns directly
+        items = self.budget_items
+        df = pd.DataFrame({
+            'Category': [item['Category'] for item in items],
+            'Name': [item['Name'] for item in items],
+            'Amount': np.fromiter((item['Amount'] for item in items), dtype=np.float64, count=len(items)),
+            'Priority': [item['Priority'] for item in items],
+        })
         
         # Calculate percentages
         total = df['Amount'].sum()
         if total > 0:
-            df['Percentage'] = round((df['Amount'] / total) * 100, 2)
+            df['Percentage'] = (df['Amount'] * (100.0 / total)).round(2)
         else:
             df['Percentage'] = 0
         
-        # Format currency amounts
-        df['Formatted Amount'] = df.apply(
-            lambda row: format_currency(row['Amount'], self.currency), 
-            axis=1
-        )
+        # Format currency amounts: symbol resolved once, one pass over the Amount column
+        symbol = currency_symbol(self.currency)
+        df['Formatted Amount'] = [f"{symbol}{amount:,.0f}" for amount in df['Amount'].tolist()]
         
         self.budget_df = df
         return df
@@ -239,81 +242,93 @@ class ComprehensiveBudgetCreator:
         if self.budget_df is None:
             return
         
-        print("\n" + "="*70)
-        print("BUDGET SUMMARY")
-        print("="*70)
+        lines = []
+        lines.append("\n" + "="*70)
+        lines.append("BUDGET SUMMARY")
+        lines.append("="*70)
         
+        # Symbol resolved once for every amount printed below
+        symbol = currency_symbol(self.currency)
         total = self.budget_df['Amount'].sum()
-        print(f"\nTotal Budget: {format_currency(total, self.currency)}")
-        print(f"Currency: {self.currency}")
-        print(f"Budget Type: {self.budget_type.upper() if self.budget_type else 'Custom'}")
-        print(f"Created: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"Total Items: {len(self.budget_df)}")
-        print(f"Total Categories: {self.budget_df['Category'].nunique()}")
+        lines.append(f"\nTotal Budget: {symbol}{total:,.0f}")
+        lines.append(f"Currency: {self.currency}")
+        lines.append(f"Budget Type: {self.budget_type.upper() if self.budget_type else 'Custom'}")
+        lines.append(f"Created: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        # One groupby serves both the category count and the breakdown table
+        category_summary = self.budget_df.groupby('Category').agg(
+            Amount=('Amount', 'sum'),
+            Percentage=('Percentage', 'sum'),
+            Items=('Name', 'count')
+        ).sort_values('Amount', ascending=False)
+        lines.append(f"Total Items: {len(self.budget_df)}")
+        lines.append(f"Total Categories: {len(category_summary)}")
         
         # Category breakdown
-        print("\n" + "-"*70)
-        print("CATEGORY BREAKDOWN")
-        print("-"*70)
-        category_summary = self.budget_df.groupby('Category').agg({
-            'Amount': 'sum',
-            'Percentage': 'sum',
-            'Name': 'count'
-        }).rename(columns={'Name': 'Items'}).sort_values('Amount', ascending=False)
-        
-        print(f"{'Category':<25} {'Amount':>15} {'Percentage':>12} {'Items':>8}")
-        print("-"*70)
-        for idx, row in category_summary.iterrows():
-            print(f"{idx:<25} {format_currency(row['Amount'], self.currency):>15} "
-                  f"{row['Percentage']:>11.1f}% {int(row['Items']):>8}")
+        lines.append("\n" + "-"*70)
+        lines.append("CATEGORY BREAKDOWN")
+        lines.append("-"*70)
+        
+        lines.append(f"{'Category':<25} {'Amount':>15} {'Percentage':>12} {'Items':>8}")
+        lines.append("-"*70)
+        for category, amount, pct, items in category_summary.itertuples(name=None):
+            amount_str = f"{symbol}{amount:,.0f}"
+            lines.append(f"{category:<25} {amount_str:>15} "
+                  f"{pct:>11.1f}% {int(items):>8}")
         
         # Priority breakdown
         if 'Priority' in self.budget_df.columns:
-            print("\n" + "-"*70)
-            print("PRIORITY BREAKDOWN")
-            print("-"*70)
+            lines.append("\n" + "-"*70)
+            lines.append("PRIORITY BREAKDOWN")
+            lines.append("-"*70)
             priority_summary = self.budget_df.groupby('Priority').agg({
                 'Amount': 'sum',
                 'Percentage': 'sum'
             }).sort_values('Amount', ascending=False)
             
-            for idx, row in priority_summary.iterrows():
-                print(f"{idx:<10} {format_currency(row['Amount'], self.currency):>15} ({row['Percentage']:.1f}%)")
+            for priority, amount, pct in priority_summary.itertuples(name=None):
+                amount_str = f"{symbol}{amount:,.0f}"
+                lines.append(f"{priority:<10} {amount_str:>15} ({pct:.1f}%)")
         
         # Top 5 expenses
-        print("\n" + "-"*70)
-        print("TOP 5 LARGEST EXPENSES")
-        print("-"*70)
+        lines.append("\n" + "-"*70)
+        lines.append("TOP 5 LARGEST EXPENSES")
+        lines.append("-"*70)
         top_5 = self.budget_df.nlargest(5, 'Amount')
-        for idx, row in top_5.iterrows():
-            print(f"{row['Name']:<30} {row['Category']:<20} {format_currency(row['Amount'], self.currency):>15}")
+        for name, category, amount in top_5[['Name', 'Category', 'Amount']].itertuples(index=False, name=None):
+            amount_str = f"{symbol}{amount:,.0f}"
+            lines.append(f"{name:<30} {category:<20} {amount_str:>15}")
         
         # Recommendations
-        print("\n" + "-"*70)
-        print("RECOMMENDATIONS")
-        print("-"*70)
+        lines.append("\n" + "-"*70)
+        lines.append("RECOMMENDATIONS")
+        lines.append("-"*70)
         recommendations = BudgetAnalyzer.get_recommendations(
             self.budget_df, 
             self.budget_type if self.budget_type != 'custom' else 'general'
         )
         for rec in recommendations:
-            print(f"  {rec}")
+            lines.append(f"  {rec}")
         
-        print("="*70)
+        lines.append("="*70)
+        
+        # The whole summary goes to stdout in one write
+        print("\n".join(lines))
     
     def create_quarterly_breakdown(self):
         """Create quarterly budget breakdown"""
         if self.budget_df is None or len(self.budget_df) == 0:
             return None
         
-        print("\n" + "="*60)
-        print("QUARTERLY BREAKDOWN")
-        print("="*60)
-        print("Select distribution method:")
-        print("1. Equal - Distribute evenly across quarters (25% each)")
-        print("2. Weighted - Business standard (Q1:20%, Q2:25%, Q3:25%, Q4:30%)")
-        print("3. Seasonal - Retail/Consumer (Q1:15%, Q2:20%, Q3:25%, Q4:40%)")
-        print("4. Skip - No quarterly breakdown")
+        print("\n".join([
+            "\n" + "="*60,
+            "QUARTERLY BREAKDOWN",
+            "="*60,
+            "Select distribution method:",
+            "1. Equal - Distribute evenly across quarters (25% each)",
+            "2. Weighted - Business standard (Q1:20%, Q2:25%, Q3:25%, Q4:30%)",
+            "3. Seasonal - Retail/Consumer (Q1:15%, Q2:20%, Q3:25%, Q4:40%)",
+            "4. Skip - No quarterly breakdown",
+        ]))
         
         while True:
             choice = input("\nSelect option (1-4): ").strip()
@@ -333,8 +348,9 @@ class ComprehensiveBudgetCreator:
                 print("Invalid choice. Please select 1-4")
         
         # Create quarterly breakdown
-        items = self.budget_df[['Category', 'Name', 'Amount']].to_dict('records')
-        quarterly_df = QuarterlyBudget.create_quarterly_breakdown(items, distribution)
+        quarterly_df = QuarterlyBudget.create_quarterly_breakdown(
+            self.budget_df[['Category', 'Name', 'Amount']], distribution
+        )
         
         # Add other columns
         if 'Priority' in self.budget_df.columns:
@@ -346,11 +362,14 @@ class ComprehensiveBudgetCreator:
         q3_total = quarterly_df['Q3'].sum()
         q4_total = quarterly_df['Q4'].sum()
         
-        print(f"\n✓ Quarterly breakdown created:")
-        print(f"  Q1: {format_currency(q1_total, self.currency)}")
-        print(f"  Q2: {format_currency(q2_total, self.currency)}")
-        print(f"  Q3: {format_currency(q3_total, self.currency)}")
-        print(f"  Q4: {format_currency(q4_total, self.currency)}")
+        symbol = currency_symbol(self.currency)
+        print("\n".join([
+            "\n✓ Quarterly breakdown created:",
+            f"  Q1: {symbol}{q1_total:,.0f}",
+            f"  Q2: {symbol}{q2_total:,.0f}",
+            f"  Q3: {symbol}{q3_total:,.0f}",
+            f"  Q4: {symbol}{q4_total:,.0f}",
+        ]))
         
         return quarterly_df
     
@@ -365,20 +384,14 @@ class ComprehensiveBudgetCreator:
         budget_type_str = self.budget_type if self.budget_type else 'custom'
         base_filename = f"budget_{budget_type_str}_{self.currency.lower()}_{timestamp}"
         
-        print("\n" + "="*60)
-        print("SAVE BUDGET")
-        print("="*60)
-        print(f"Default filename: {base_filename}")
+        print("\n".join(["\n" + "="*60, "SAVE BUDGET", "="*60, f"Default filename: {base_filename}"]))
         custom_name = input("Enter custom name (or press Enter to use default): ").strip()
         
         if custom_name:
             base_filename = custom_name
         
         # Ask for format
-        print("\nSelect export format:")
-        print("1. CSV only")
-        print("2. Excel only (with formatting)")
-        print("3. Both CSV and Excel")
+        print("\n".join(["\nSelect export format:", "1. CSV only", "2. Excel only (with formatting)", "3. Both CSV and Excel"]))
         
         format_choice = input("Select format (1-3): ").strip()
         
@@ -389,13 +402,11 @@ class ComprehensiveBudgetCreator:
         if 'Priority' in self.budget_df.columns:
             export_cols.insert(2, 'Priority')
         
-        export_df = self.budget_df[export_cols].copy()
-        
         # Save CSV
         if format_choice in ['1', '3']:
             csv_filename = f"{base_filename}.csv"
             csv_path = os.path.join(self.output_dir, csv_filename)
-            export_df.to_csv(csv_path, index=False)
+            self.budget_df.to_csv(csv_path, index=False, columns=export_cols)
             print(f"\n✓ CSV saved: {csv_path}")
             saved_files.append(csv_path)
         
@@ -414,67 +425,17 @@ class ComprehensiveBudgetCreator:
                     'Percentage': 'Percentage (%)'
                 }
                 
-                df_export = export_df.rename(columns=column_mapping)
+                df_export = self.budget_df[export_cols].rename(columns=column_mapping)
                 
-                with pd.ExcelWriter(excel_path, engine='openpyxl') as writer:
-                    df_export.to_excel(writer, sheet_name='Budget', index=False)
-                    
-                    # Get worksheet for formatting
-                    worksheet = writer.sheets['Budget']
-                    
-                    # Import styling
-                    from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-                    
-                    # Header formatting
-                    header_fill = PatternFill(start_color='366092', end_color='366092', fill_type='solid')
-                    header_font = Font(bold=True, color='FFFFFF', size=11)
-                    
-                    for col_idx, col in enumerate(df_export.columns, 1):
-                        cell = worksheet.cell(row=1, column=col_idx)
-                        cell.fill = header_fill
-                        cell.font = header_font
-                        cell.alignment = Alignment(horizontal='center', vertical='center')
-                        
-                        # Auto-adjust width
-                        max_length = max(
-                            df_export[col].astype(str).apply(len).max(),
-                            len(col)
-                        ) + 2
-                        column_letter = cell.column_letter
-                        worksheet.column_dimensions[column_letter].width = min(max_length, 50)
-                    
-                    # Add borders
-                    thin_border = Border(
-                        left=Side(style='thin'),
-                        right=Side(style='thin'),
-                        top=Side(style='thin'),
-                        bottom=Side(style='thin')
-                    )
-                    
-                    for row in worksheet.iter_rows(min_row=1, max_row=len(df_export)+1,
-                                                   min_col=1, max_col=len(df_export.columns)):
-                        for cell in row:
-                            cell.border = thin_border
-                            if cell.row > 1:
-                                cell.alignment = Alignment(horizontal='left', vertical='center')
-                    
-                    # Add summary at bottom
-                    summary_row = len(df_export) + 3
-                    worksheet.cell(row=summary_row, column=1, value="Budget Summary")
-                    worksheet.cell(row=summary_row, column=1).font = Font(bold=True, size=12)
-                    
-                    total = self.budget_df['Amount'].sum()
-                    worksheet.cell(row=summary_row+1, column=1, value="Total Budget:")
-                    worksheet.cell(row=summary_row+1, column=2, value=format_currency(total, self.currency))
-                    
-                    worksheet.cell(row=summary_row+2, column=1, value="Budget Type:")
-                    worksheet.cell(row=summary_row+2, column=2, value=self.budget_type.upper() if self.budget_type else 'Custom')
-                    
-                    worksheet.cell(row=summary_row+3, column=1, value="Currency:")
-                    worksheet.cell(row=summary_row+3, column=2, value=self.currency)
-                    
-                    worksheet.cell(row=summary_row+4, column=1, value="Created:")
-                    worksheet.cell(row=summary_row+4, column=2, value=datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+                # Streamed write: rows are styled as they are emitted, no second pass over cells
+                total = self.budget_df['Amount'].sum()
+                summary = [
+                    ("Total Budget:", format_currency(total, self.currency)),
+                    ("Budget Type:", self.budget_type.upper() if self.budget_type else 'Custom'),
+                    ("Currency:", self.currency),
+                    ("Created:", datetime.now().strftime('%Y-%m-%d %H:%M:%S')),
+                ]
+                write_excel_report(excel_path, df_export, sheet_name='Budget', summary=summary)
                 
                 print(f"✓ Excel report saved: {excel_path}")
                 saved_files.append(excel_path)
@@ -491,9 +452,7 @@ class ComprehensiveBudgetCreator:
             print("\n⚠️  Approval system not available")
             return
         
-        print("\n" + "="*60)
-        print("BUDGET APPROVAL PROCESS")
-        print("="*60)
+        print("\n".join(["\n" + "="*60, "BUDGET APPROVAL PROCESS", "="*60]))
         
         run_approval = input("Would you like to run the approval process? (y/n): ").strip().lower()
         
@@ -507,11 +466,13 @@ class ComprehensiveBudgetCreator:
 
 def main():
     """Main comprehensive budget creation workflow"""
-    print("="*70)
-    print("COMPREHENSIVE BUDGET CREATION SYSTEM")
-    print("="*70)
-    print("Create professional budgets with templates, analysis, and reports")
-    print()
+    print("\n".join([
+        "="*70,
+        "COMPREHENSIVE BUDGET CREATION SYSTEM",
+        "="*70,
+        "Create professional budgets with templates, analysis, and reports",
+        "",
+    ]))
     
     creator = ComprehensiveBudgetCreator()
     
@@ -554,14 +515,16 @@ def main():
     if saved_file and saved_file.endswith('.csv') and APPROVAL_SYSTEM_AVAILABLE:
         creator.run_approval_process(saved_file)
     
-    print("\n" + "="*70)
-    print("✓ BUDGET CREATION COMPLETE")
-    print("="*70)
-    print(f"Files saved in: {creator.output_dir}/")
-    print("\nNext steps:")
-    print("- Review your budget report")
-    print("- Run approval process if not done: python budget_approval.py")
-    print("- Use complete workflow: python run_workflow.py")
+    print("\n".join([
+        "\n" + "="*70,
+        "✓ BUDGET CREATION COMPLETE",
+        "="*70,
+        f"Files saved in: {creator.output_dir}/",
+        "\nNext steps:",
+        "- Review your budget report",
+        "- Run approval process if not done: python budget_approval.py",
+        "- Use complete workflow: python run_workflow.py",
+    ]))
 
 
 if __name__ == "__main__":
@@ -4,10 +4,54 @@ Budget Automation Integration Script
 This script demonstrates the complete workflow from budget creation to approval
 """
 
+import argparse
 import os
 import sys
-import pandas as pd
 from datetime import datetime
+from importlib import import_module
+from importlib.util import find_spec
+
+# Rust-based Excel reader, used instead of openpyxl when installed
+CALAMINE_AVAILABLE = find_spec("python_calamine") is not None
+
+# Budget creation menu: option -> module whose main() runs the creation flow
+_CREATION_MODULES = {
+    '1': 'budget_automation',
+    '2': 'comprehensive_budget',
+}
+
+# Neat report column titles, by approved-budget column name
+REPORT_COLUMN_TITLES = {
+    'Category': 'Budget Category',
+    'Q1': 'Q1 Budget',
+    'Q2': 'Q2 Budget',
+    'Q3': 'Q3 Budget',
+    'Q4': 'Q4 Budget',
+    'Total': 'Annual Total',
+    'Approval_Status': 'Approval Status',
+    'Approved_By': 'Approved By',
+    'Approval_Date': 'Approval Date',
+    'Comments': 'Comments'
+}
+
+def _read_budget_workbook(file_path):
+    """
+    Read the first sheet of an approved budget workbook as a tuple of row tuples (header first)
+    """
+    if CALAMINE_AVAILABLE:
+        from python_calamine import CalamineWorkbook
+        sheet = CalamineWorkbook.from_path(file_path).get_sheet_by_index(0)
+        # Calamine reports empty cells as ''
+        raw = ([None if value == '' else value for value in row] for row in sheet.to_python())
+    else:
+        from openpyxl import load_workbook
+        workbook = load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            raw = list(workbook.worksheets[0].iter_rows(values_only=True))
+        finally:
+            workbook.close()
+    # Blank rows are dropped, as pandas.read_excel does
+    return tuple(tuple(row) for row in raw if any(value is not None for value in row))
 
 def run_budget_creation():
     """Run the budget creation process"""
@@ -19,19 +63,15 @@ def run_budget_creation():
     print("1. Basic Budget Creation (budget_automation.py)")
     print("2. Comprehensive Budget with Templates (comprehensive_budget.py)")
     
-    while True:
-        choice = input("\nSelect option (1 or 2): ").strip()
-        if choice in ['1', '2']:
-            break
+    choice = input("\nSelect option (1 or 2): ").strip()
+    while choice not in _CREATION_MODULES:
         print("Invalid choice. Please enter 1 or 2")
+        choice = input("\nSelect option (1 or 2): ").strip()
     
     try:
+        import_module(_CREATION_MODULES[choice]).main()
         if choice == '1':
-            import budget_automation
             print("Budget creation completed successfully!")
-        else:
-            import comprehensive_budget
-            comprehensive_budget.main()
         return True
     except Exception as e:
         print(f"Error in budget creation: {str(e)}")
@@ -62,45 +102,23 @@ def export_budget_report(input_file='budget_with_approval.xlsx', output_file=Non
             print(f"Error: {input_file} not found. Please complete approval first.")
             return False
         
-        # Read the approved budget
-        df = pd.read_excel(input_file)
+        # The report writer is only loaded once a report is actually exported
+        from budget_automation import write_excel_rows
         
-        # Create neat column titles for report
-        column_mapping = {
-            'Category': 'Budget Category',
-            'Q1': 'Q1 Budget',
-            'Q2': 'Q2 Budget',
-            'Q3': 'Q3 Budget',
-            'Q4': 'Q4 Budget',
-            'Total': 'Annual Total',
-            'Approval_Status': 'Approval Status',
-            'Approved_By': 'Approved By',
-            'Approval_Date': 'Approval Date',
-            'Comments': 'Comments'
-        }
+        # Read the approved budget as plain rows; the fixed report schema needs no DataFrame
+        rows = _read_budget_workbook(input_file)
+        columns = rows[0] if rows else ()
+        body = rows[1:]
         
-        df_report = df.rename(columns=column_mapping)
+        # Neat column titles for the report
+        headers = [REPORT_COLUMN_TITLES.get(col, col) for col in columns]
         
         # Generate output filename with timestamp
         if output_file is None:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             output_file = f'budget_report_{timestamp}.xlsx'
         
-        # Export with formatting
-        with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
-            df_report.to_excel(writer, sheet_name='Budget Report', index=False)
-            
-            # Get workbook and worksheet
-            workbook = writer.book
-            worksheet = writer.sheets['Budget Report']
-            
-            # Auto-adjust column widths
-            for idx, col in enumerate(df_report.columns, 1):
-                max_length = max(
-                    df_report[col].astype(str).apply(len).max(),
-                    len(col)
-                ) + 2
-                worksheet.column_dimensions[chr(64 + idx)].width = min(max_length, 50)
+        write_excel_rows(output_file, headers, body, sheet_name='Budget Report')
         
         print(f"✓ Budget report exported successfully: {output_file}")
         return True
@@ -109,8 +127,49 @@ def export_budget_report(input_file='budget_with_approval.xlsx', output_file=Non
         print(f"Error exporting report: {str(e)}")
         return False
 
-def main():
+# Workflow steps in order: (prompt, step, message when declined, message when failed)
+_WORKFLOW_STEPS = (
+    (None, run_budget_creation,
+     None, "Budget creation failed. Cannot proceed to approval."),
+    ("\nProceed to budget approval? (y/n): ", run_budget_approval,
+     "Budget approval skipped. You can run it later using budget_approval.py", "Budget approval failed."),
+    ("\nExport budget report? (y/n): ", export_budget_report,
+     None, None),
+)
+
+def parse_args(argv=None):
+    """Parse the optional command that runs a single workflow step"""
+    parser = argparse.ArgumentParser(description="Budget automation workflow")
+    parser.add_argument('-y', '--yes', action='store_true',
+                        help="answer yes to the workflow's proceed prompts")
+    subparsers = parser.add_subparsers(dest='command')
+    subparsers.add_parser('create', help="create a budget")
+    subparsers.add_parser('approve', help="approve an existing budget")
+    export_parser = subparsers.add_parser('export', help="export an approved budget as a report")
+    export_parser.add_argument('--input', default='budget_with_approval.xlsx',
+                               help="approved budget workbook (default: %(default)s)")
+    export_parser.add_argument('--output', default=None,
+                               help="report file (default: timestamped budget_report_*.xlsx)")
+    return parser.parse_args(argv)
+
+def confirm(prompt, assume_yes=False):
+    """Ask a y/n question; --yes answers it without prompting"""
+    if assume_yes:
+        return True
+    return input(prompt).strip().lower() in ['y', 'yes']
+
+def main(argv=None):
     """Main integration workflow"""
+    args = parse_args(argv)
+    
+    # Single steps run directly, without the workflow prompts
+    if args.command == 'create':
+        return run_budget_creation()
+    if args.command == 'approve':
+        return run_budget_approval()
+    if args.command == 'export':
+        return export_budget_report(args.input, args.output)
+    
     print("BUDGET AUTOMATION - COMPLETE WORKFLOW")
     print("="*60)
     print("This script will guide you through:")
@@ -119,33 +178,27 @@ def main():
     print("3. Exporting budget report (formatted Excel)")
     print()
     
-    choice = input("Do you want to run the complete workflow? (y/n): ").strip().lower()
-    
-    if choice in ['y', 'yes']:
-        # Step 1: Create budget
-        if run_budget_creation():
-            # Step 2: Approve budget
-            approve_choice = input("\nProceed to budget approval? (y/n): ").strip().lower()
-            if approve_choice in ['y', 'yes']:
-                if run_budget_approval():
-                    # Step 3: Export report
-                    export_choice = input("\nExport budget report? (y/n): ").strip().lower()
-                    if export_choice in ['y', 'yes']:
-                        export_budget_report()
-                else:
-                    print("Budget approval failed.")
-            else:
-                print("Budget approval skipped. You can run it later using budget_approval.py")
-        else:
-            print("Budget creation failed. Cannot proceed to approval.")
-    else:
+    if not confirm("Do you want to run the complete workflow? (y/n): ", args.yes):
         print("Workflow cancelled.")
         
         # Offer individual components
         print("\nYou can run individual components:")
         print("- python budget_automation.py (create budget)")
         print("- python budget_approval.py (approve existing budget)")
-        print("- Run this script and export only (for existing approved budgets)")
+        print("- python run_workflow.py export --input <file> (export an approved budget)")
+        return
+    
+    # Each step runs after its prompt (if any) and stops the workflow when declined or failed
+    for prompt, run_step, skipped_message, failed_message in _WORKFLOW_STEPS:
+        if prompt and not confirm(prompt, args.yes):
+            if skipped_message:
+                print(skipped_message)
+            break
+        if not run_step():
+            if failed_message:
+                print(failed_message)
+            break
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    # Single-step commands report failure through the exit status
+    sys.exit(0 if main() is not False else 1)
@@ -0,0 +1,79 @@
+"""
+Regression tests for the budget approval calculations
+Run with: python -m unittest test_budget_approval (or pytest)
+"""
+
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from budget_approval import BudgetApprovalSystem
+from budget_automation import top_n_positions
+
+
+def _budget():
+    return pd.DataFrame({
+        'Category': ['Housing', 'Food', 'Food', 'Savings'],
+        'Name': ['Rent', 'Groceries', 'Dining', 'Emergency Fund'],
+        'Amount': [1500.0, 400.0, 100.0, 500.0],
+        'Percentage': [60.0, 16.0, 4.0, 20.0],
+    })
+
+
+class TestInPlaceEdits(unittest.TestCase):
+    """Totals and summaries must follow edits made to the same frame object"""
+    
+    def setUp(self):
+        self.system = BudgetApprovalSystem()
+    
+    def test_total_after_same_length_edit(self):
+        df = _budget()
+        self.assertEqual(self.system.calculate_total_amount(df), 2500.0)
+        
+        # Same object, same length: only the values change
+        df.loc[df['Name'] == 'Rent', 'Amount'] = 1000.0
+        self.assertEqual(self.system.calculate_total_amount(df), 2000.0)
+    
+    def test_category_summary_after_same_length_edit(self):
+        df = _budget()
+        self.system.get_category_summary(df)
+        
+        df.loc[df['Name'] == 'Dining', 'Amount'] = 0.0
+        summary = self.system.get_category_summary(df).set_index('Category')
+        self.assertEqual(summary.loc['Food', 'Amount'], 400.0)
+        self.assertEqual(summary.loc['Food', 'Item_Count'], 2)
+
+
+
+class TestTopNPositions(unittest.TestCase):
+    """top_n_positions must pick the same rows, in the same order, as nlargest"""
+    
+    def assertMatchesNlargest(self, amounts, n=5):
+        # Missing amounts are never top expenses (pandas 3's nlargest would pad with them)
+        expected = amounts.dropna().nlargest(n).index.tolist()
+        self.assertEqual(amounts.index[top_n_positions(amounts, n)].tolist(), expected)
+    
+    def test_ties_at_the_cutoff(self):
+        # Four rows tie for the last two places; nlargest keeps the first two
+        self.assertMatchesNlargest(pd.Series([50.0, 10.0, 30.0, 30.0, 10.0, 30.0, 30.0, 40.0]))
+    
+    def test_all_equal(self):
+        self.assertMatchesNlargest(pd.Series([20.0] * 8))
+    
+    def test_missing_amounts_and_short_frames(self):
+        self.assertMatchesNlargest(pd.Series([np.nan, 5.0, np.nan, 5.0, 1.0]))
+        self.assertMatchesNlargest(pd.Series([np.nan, np.nan]))
+        self.assertMatchesNlargest(pd.Series([], dtype='float64'))
+    
+    def test_random_amounts_with_ties(self):
+        rng = np.random.default_rng(0)
+        for size in range(1, 40):
+            # Few distinct values, so ties are common
+            amounts = pd.Series(rng.integers(0, 6, size).astype('float64'))
+            amounts[rng.random(size) < 0.1] = np.nan
+            self.assertMatchesNlargest(amounts)
+
+
+if __name__ == '__main__':
+    unittest.main()